@@ -1,77 +1,131 @@
+import json
+import logging
+import mmap
 import os
 import re
+from functools import lru_cache
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
+log = logging.getLogger(__name__)
+
+# Extracted genres are cached per folder, keyed by file name, mtime and size
+GENRE_CACHE_FILE = ".genre_cache.json"
+# Bump when the extraction logic changes so stale caches are ignored
+_GENRE_CACHE_VERSION = 1
+
+# precompile the wiki markup patterns once instead of on every call
+_WIKI_LINK_RE = re.compile(r'\[\[(?:[^|\]]*\|)?([^\]]+)\]\]')
+_REF_BLOCK_RE = re.compile(r'<ref[^>]*>.*?</ref>', re.DOTALL)
+_REF_SELF_RE = re.compile(r'<ref[^>]*/>')
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+# <ref>...</ref>, <ref .../>, bare <ref ...> and comments in one pass; URLs have to
+# go in a second pass or they would swallow a <ref> glued onto their end
+_MARKUP_STRIP_RE = re.compile(r'<ref[^>]*(?:/>|>.*?</ref>|>)|<!--.*?-->', re.DOTALL)
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+# brackets, curly braces and quotes are plain single-character deletions
+_PUNCT_DELETE = str.maketrans('', '', '[]{}"\'`')
+# characters that any of the patterns above need in order to match
+_MARKUP_CHARS = frozenset('[]{}<"\'`:.')
+_TEMPLATE_HEAD_RE = re.compile(r'^\{\{[^|]*\|?')
+_TEMPLATE_TAIL_RE = re.compile(r'\}\}$')
+_NOWRAP_RE = re.compile(r'\{\{nowrap\|([^}]+)\}\}', re.IGNORECASE)
+_LIST_TEMPLATE_RE = re.compile(r'\{\{(?:flatlist|hlist|flat list|unbulleted list|plainlist)[^{]*', re.IGNORECASE)
+_STAR_SPLIT_RE = re.compile(r'\*+')
+_PIPE_SPLIT_RE = re.compile(r'\|')
+_PAREN_KEEP_RE = re.compile(r'\(.*(?:early|later|late|mid).*\)', re.IGNORECASE)
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_DELIM_RE = re.compile(r'[,;/\n•·|]')
+# infobox patterns work on the raw page bytes, wiki markup itself is ASCII
+_INFOBOX_RE = re.compile(rb'\{\{Infobox[^{]*', re.DOTALL | re.IGNORECASE)
+_GENRE_FIELD_SEARCH_RE = re.compile(rb'\n[^\S\n]*\|[^\S\n]*genres?[^\S\n]*=[^\S\n]*', re.IGNORECASE)
+_GENRE_FIELD_PREFIX_RE = re.compile(rb'^\s*\|\s*genres?\s*=\s*', re.IGNORECASE)
+
+# Standardize rock and roll variations
+_ROCK_VARIATIONS = {
+    "rock 'n' roll": "rock and roll",
+    "rock n roll": "rock and roll",
+    "rock'n'roll": "rock and roll",
+    "rock & roll": "rock and roll",
+    "rock n' roll": "rock and roll"
+}
+
+# Filter out common non-genre terms and artifacts
+_SKIP_TERMS = frozenset(['music', 'band', 'group', '', 'cite web', 'cite book',
+     'first', 'last', 'url', 'title', 'ref', 'name', 'am',
+     'allmusic', 'www', 'com', 'http', 'https', 'ref name',
+     'work', 'date', 'publisher', 'website', 'access-date',
+     'archive-date', 'archive-url', 'page', 'isbn', 'year',
+     'citation', 'url-status', 'live', 'rock music', 'rock'])
+
+@lru_cache(maxsize=8192)
 def normalize_genre(genre: str) -> str:
     """
     Normalize genre names by lowercasing and standardizing variations.
+    Results are cached since the same raw genre strings recur across many infoboxes.
     """
     genre = genre.lower().strip()
     
-    # Remove wiki markup [[Genre]] or [[Genre|Display]]
-    genre = re.sub(r'\[\[(?:[^|\]]*\|)?([^\]]+)\]\]', r'\1', genre)
-    
-    # Remove any remaining brackets
-    genre = re.sub(r'[\[\]]', '', genre)
-    
-    # Remove references like <ref>...</ref> or <ref name="..."/>
-    genre = re.sub(r'<ref[^>]*>.*?</ref>', '', genre, flags=re.DOTALL)
-    genre = re.sub(r'<ref[^>]*/>', '', genre)
-    genre = re.sub(r'<ref[^>]*>', '', genre)
-    
-    # Remove HTML comments
-    genre = re.sub(r'<!--.*?-->', '', genre, flags=re.DOTALL)
-    
-    # Remove URLs
-    genre = re.sub(r'https?://[^\s]+', '', genre)
-    genre = re.sub(r'www\.[^\s]+', '', genre)
-    
-    # Remove curly braces and quotes
-    genre = re.sub(r'[{}"\'`]', '', genre)
+    # Only plain text from here on unless some markup character shows up
+    if not _MARKUP_CHARS.isdisjoint(genre):
+        # Remove wiki markup [[Genre]] or [[Genre|Display]]
+        if '[[' in genre:
+            genre = _WIKI_LINK_RE.sub(r'\1', genre)
+        
+        # Remove references like <ref>...</ref> or <ref name="..."/> and HTML comments
+        if '<' in genre:
+            genre = _MARKUP_STRIP_RE.sub('', genre)
+        
+        # Remove URLs
+        if '://' in genre or 'www.' in genre:
+            genre = _URL_RE.sub('', genre)
+        
+        # Remove leftover brackets, curly braces and quotes
+        genre = genre.translate(_PUNCT_DELETE)
     
     # Standardize rock and roll variations
-    rock_variations = {
-        "rock 'n' roll": "rock and roll",
-        "rock n roll": "rock and roll",
-        "rock'n'roll": "rock and roll",
-        "rock & roll": "rock and roll",
-        "rock n' roll": "rock and roll"
-    }
-    
-    for variant, standard in rock_variations.items():
-        if genre == variant:
-            genre = standard
+    genre = _ROCK_VARIATIONS.get(genre, genre)
     
     # Clean up whitespace
     genre = ' '.join(genre.split())
     
     return genre.strip()
 
+def _find_matching_brace(text: str, start: int, open_char: str = '{', close_char: str = '}') -> int:
+    """
+    Return the index just past the bracket that closes the one at start, or -1.
+    Jumps between bracket characters with str.find instead of visiting every character.
+    """
+    depth = 0
+    next_open = text.find(open_char, start)
+    next_close = text.find(close_char, start)
+    
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            next_open = text.find(open_char, next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close + 1
+            next_close = text.find(close_char, next_close + 1)
+    
+    return -1
+
 def extract_nested_content(text: str, open_char: str = '{', close_char: str = '}') -> str:
     """
     Extract content with properly matched nested brackets.
     """
-    if open_char not in text:
-        return text
-        
-    result = []
-    depth = 0
     start_idx = text.find(open_char)
     
     if start_idx == -1:
         return text
-        
-    for i, char in enumerate(text[start_idx:], start_idx):
-        if char == open_char:
-            depth += 1
-        elif char == close_char:
-            depth -= 1
-            if depth == 0:
-                result.append(text[start_idx:i+1])
-                break
-        
-    return ''.join(result) if result else text
+    
+    end_idx = _find_matching_brace(text, start_idx, open_char, close_char)
+    
+    return text[start_idx:end_idx] if end_idx != -1 else text
 
 def parse_genre_field(genre_text: str) -> List[str]:
     """
@@ -79,88 +133,87 @@ def parse_genre_field(genre_text: str) -> List[str]:
     """
     genres = []
     
+    # Every regex below is guarded by a plain substring test, which is much
+    # cheaper and lets the common plain "a, b, c" field skip them entirely
+    
     # Remove HTML comments first
-    genre_text = re.sub(r'<!--.*?-->', '', genre_text, flags=re.DOTALL)
+    if '<!--' in genre_text:
+        genre_text = _HTML_COMMENT_RE.sub('', genre_text)
 
     # FIRST: Remove all reference tags and their content before processing
     # This is the key fix - do this BEFORE any other processing
-    genre_text = re.sub(r'<ref[^>]*>.*?</ref>', '', genre_text, flags=re.DOTALL)
-    genre_text = re.sub(r'<ref[^>]*/>', '', genre_text)
+    if '<ref' in genre_text:
+        genre_text = _REF_BLOCK_RE.sub('', genre_text)
+        genre_text = _REF_SELF_RE.sub('', genre_text)
 
     # Remove template name and brackets
-    genre_text = re.sub(r'^\{\{[^|]*\|?', '', genre_text)
-    genre_text = re.sub(r'\}\}$', '', genre_text)
+    if genre_text.startswith('{{'):
+        genre_text = _TEMPLATE_HEAD_RE.sub('', genre_text)
+    if '}}' in genre_text:
+        genre_text = _TEMPLATE_TAIL_RE.sub('', genre_text)
 
     # Handle {{nowrap|...}} templates
-    genre_text = re.sub(r'\{\{nowrap\|([^}]+)\}\}', r'\1', genre_text, flags=re.IGNORECASE)
+    has_template = '{{' in genre_text
+    if has_template:
+        genre_text = _NOWRAP_RE.sub(r'\1', genre_text)
     
     # Handle {{flatlist|...}} or {{hlist|...}} templates
-    if re.search(r'\{\{(flatlist|hlist|flat list|unbulleted list|plainlist)', genre_text, re.IGNORECASE):
+    template_match = _LIST_TEMPLATE_RE.search(genre_text) if has_template else None
+    if template_match:
         # Extract the template content
-        template_match = re.search(r'\{\{(?:flatlist|hlist|flat list|unbulleted list|plainlist)[^{]*', genre_text, re.IGNORECASE)
-        if template_match:
-            # Find the complete template including nested templates
-            template_start = template_match.start()
-            template_text = genre_text[template_start:]
+        # Find the complete template including nested templates
+        template_start = template_match.start()
+        template_end = _find_matching_brace(genre_text, template_start)
+        
+        if template_end != -1:
+            template_content = genre_text[template_start:template_end]
             
-            # Count brackets to find the end
-            depth = 0
-            end_pos = 0
-            for i, char in enumerate(template_text):
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end_pos = i + 1
-                        break
+            # Remove template wrapper
+            template_content = _TEMPLATE_HEAD_RE.sub('', template_content)
+            template_content = _TEMPLATE_TAIL_RE.sub('', template_content)
+            
+            # Parse items (handle both * lists and | separated)
+            if '*' in template_content:
+                items = _STAR_SPLIT_RE.split(template_content)
+            else:
+                items = _PIPE_SPLIT_RE.split(template_content)
             
-            if end_pos > 0:
-                template_content = template_text[:end_pos]
-                
-                # Remove template wrapper
-                template_content = re.sub(r'^\{\{[^|]*\|?', '', template_content)
-                template_content = re.sub(r'\}\}$', '', template_content)
-                
-                # Parse items (handle both * lists and | separated)
-                if '*' in template_content:
-                    items = re.split(r'\*+', template_content)
-                else:
-                    items = re.split(r'\|', template_content)
-                
-                for item in items:
+            for item in items:
+                item = item.strip()
+                if item:
+                    # Handle wiki links
+                    if '[[' in item:
+                        item = _WIKI_LINK_RE.sub(r'\1', item)
+                    # Remove nowrap
+                    if '{{' in item:
+                        item = _NOWRAP_RE.sub(r'\1', item)
+                    # Remove parenthetical additions
+                    if '(' in item:
+                        # Keep content in parentheses if it contains "early", "later", etc.
+                        if _PAREN_KEEP_RE.search(item):
+                            # Keep it as is or you could append it
+                            pass
+                        else:
+                            item = _PAREN_RE.sub('', item)
+                    
                     item = item.strip()
-                    if item:
-                        # Handle wiki links
-                        item = re.sub(r'\[\[(?:[^|\]]*\|)?([^\]]+)\]\]', r'\1', item)
-                        # Remove nowrap
-                        item = re.sub(r'\{\{nowrap\|([^}]+)\}\}', r'\1', item, flags=re.IGNORECASE)
-                        # Remove parenthetical additions
-                        if '(' in item:
-                            # Keep content in parentheses if it contains "early", "later", etc.
-                            if re.search(r'\(.*(?:early|later|late|mid).*\)', item, re.IGNORECASE):
-                                # Keep it as is or you could append it
-                                pass
-                            else:
-                                item = re.sub(r'\([^)]*\)', '', item)
-                        
-                        item = item.strip()
-                        if item and not item.startswith('<!--'):
-                            genres.append(item)
+                    if item and not item.startswith('<!--'):
+                        genres.append(item)
     else:
         # Handle simple formats
         # Remove <br> tags
-        genre_text = re.sub(r'<br\s*/?>', ',', genre_text, flags=re.IGNORECASE)
+        if '<' in genre_text:
+            genre_text = _BR_RE.sub(',', genre_text)
         
         # Split by common delimiters
-        raw_genres = re.split(r'[,;/\n•·|]', genre_text)
+        raw_genres = _DELIM_RE.split(genre_text)
         
         for genre in raw_genres:
             genre = genre.strip()
             
             # Handle wiki links
             if '[[' in genre:
-                genre = re.sub(r'\[\[(?:[^|\]]*\|)?([^\]]+)\]\]', r'\1', genre)
+                genre = _WIKI_LINK_RE.sub(r'\1', genre)
             
             # Skip if empty or template/comment
             if not genre or genre.startswith('{{') or genre.startswith('<!--') or genre.startswith('<ref'):
@@ -170,6 +223,7 @@ def parse_genre_field(genre_text: str) -> List[str]:
     
     # Normalize all genres
     normalized_genres = []
+    seen = set()
     for genre in genres:
 
 
@@ -179,83 +233,73 @@ def parse_genre_field(genre_text: str) -> List[str]:
 
 
         
-        # Filter out common non-genre terms and artifacts
-        skip_terms = ['music', 'band', 'group', '', 'cite web', 'cite book', 
-             'first', 'last', 'url', 'title', 'ref', 'name', 'am',
-             'allmusic', 'www', 'com', 'http', 'https', 'ref name',
-             'work', 'date', 'publisher', 'website', 'access-date',
-             'archive-date', 'archive-url', 'page', 'isbn', 'year',
-             'citation', 'url-status', 'live', 'rock music', 'rock']
-        
         # Check if it's actually a genre (not just punctuation or a skip term)
-        if normalized and len(normalized) > 1 and normalized not in skip_terms:
+        if normalized and len(normalized) > 1 and normalized not in _SKIP_TERMS:
             # Additional check: if it contains 'ref' or 'cite' it's probably not a genre
             if 'ref' not in normalized and 'cite' not in normalized and '.' not in normalized:
-                if normalized not in normalized_genres:
+                if normalized not in seen:
+                    seen.add(normalized)
                     normalized_genres.append(normalized)
     
     return normalized_genres
 
-def extract_genres_from_infobox(text: str) -> Optional[List[str]]:
+def extract_genres_from_infobox(text: Union[str, bytes, mmap.mmap]) -> Optional[List[str]]:
     """
     Extract genres from the infobox section of a Wikipedia page text.
+    The page can also be given as UTF-8 bytes or an mmap; only the genre field gets decoded.
     Returns None if no infobox or no genre field found.
     """
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    
     # Find infobox with better pattern
-    infobox_pattern = r'\{\{Infobox[^{]*'
-    infobox_match = re.search(infobox_pattern, text, re.DOTALL | re.IGNORECASE)
+    infobox_match = _INFOBOX_RE.search(text)
     
     if not infobox_match:
         return None
     
     # Find the complete infobox by counting brackets
     infobox_start = infobox_match.start()
-    text_from_start = text[infobox_start:]
+    infobox_end = _find_matching_brace(text, infobox_start, b'{', b'}')
     
-    depth = 0
-    infobox_end = len(text_from_start)
-    
-    for i, char in enumerate(text_from_start):
-        if char == '{':
-            depth += 1
-        elif char == '}':
-            depth -= 1
-            if depth == 0:
-                infobox_end = i + 1
-                break
-    
-    infobox_text = text_from_start[:infobox_end]
+    infobox_text = text[infobox_start:infobox_end] if infobox_end != -1 else text[infobox_start:]
     
     # Look for genre or genres field - match everything until we hit another field (|) at the same depth
-    # This pattern looks for | genre = and captures everything until the next | at the base level
-    lines = infobox_text.split('\n')
+    # The field is located with one search, then walked line by line without splitting the infobox
+    field_match = _GENRE_FIELD_SEARCH_RE.search(infobox_text)
+    
+    if not field_match:
+        return None
     
     genre_content = []
-    in_genre_field = False
+    field_start = field_match.end()
+    pos = field_start
     bracket_depth = 0
     
-    for line in lines:
-        # Check if this line starts a genre field
-        if re.match(r'\s*\|\s*genres?\s*=', line, re.IGNORECASE):
-            in_genre_field = True
-            # Get the content after the = sign
-            genre_line = re.sub(r'^\s*\|\s*genres?\s*=\s*', '', line, flags=re.IGNORECASE)
-            genre_content.append(genre_line)
-            # Count brackets in this line
-            bracket_depth = genre_line.count('{') - genre_line.count('}')
-        elif in_genre_field:
-            # Check if we've hit a new field (line starting with | and bracket depth is 0)
-            if line.strip().startswith('|') and bracket_depth == 0:
-                in_genre_field = False
+    while True:
+        line_end = infobox_text.find(b'\n', pos)
+        if line_end == -1:
+            genre_content.append(infobox_text[field_start:])
+            break
+        # Count brackets in this line
+        bracket_depth += infobox_text.count(b'{', pos, line_end) - infobox_text.count(b'}', pos, line_end)
+        
+        pos = line_end + 1
+        next_end = infobox_text.find(b'\n', pos)
+        line = infobox_text[pos:] if next_end == -1 else infobox_text[pos:next_end]
+        if line.lstrip().startswith(b'|'):
+            restart = _GENRE_FIELD_PREFIX_RE.match(line)
+            if restart:
+                # A repeated genre field keeps adding to the same content
+                genre_content.append(infobox_text[field_start:line_end])
+                field_start = pos = pos + restart.end()
+                bracket_depth = 0
+            elif bracket_depth == 0:
+                # We've hit a new field
+                genre_content.append(infobox_text[field_start:line_end])
                 break
-            else:
-                genre_content.append(line)
-                bracket_depth += line.count('{') - line.count('}')
     
-    if not genre_content:
-        return None
-    
-    genre_text = '\n'.join(genre_content)
+    genre_text = b'\n'.join(genre_content).decode('utf-8', errors='ignore')
     
     # Parse the genre field
     genres = parse_genre_field(genre_text)
@@ -267,19 +311,70 @@ def extract_artist_name_from_filename(filename: str) -> str:
     Extract artist name from filename.
     """
     # Remove .txt extension
-    name = os.path.splitext(filename)[0]
+    name = filename[:-4]
+    if not filename.endswith('.txt') or not name.strip('.'):
+        name = os.path.splitext(filename)[0]
     
     # Replace underscores with spaces if present
     name = name.replace('_', ' ')
     
-    # Remove "(band)" or similar suffixes if present
-    name = re.sub(r'\s*\([^)]*\)\s*$', '', name)
+    # Remove "(band)" or similar suffixes if present, i.e. the last
+    # parenthetical when nothing but whitespace follows it
+    stripped = name.rstrip()
+    if stripped.endswith(')'):
+        close = len(stripped) - 1
+        open_idx = stripped.find('(', stripped.rfind(')', 0, close) + 1, close)
+        if open_idx != -1:
+            name = stripped[:open_idx]
     
     return name.strip()
 
-def process_wiki_files(folder_path: str) -> Dict[str, List[str]]:
+def _load_genre_cache(cache_path: Path) -> Dict[str, list]:
+    """
+    Load the {file name: [mtime_ns, size, genres]} cache, or an empty one if missing or stale.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(cache, dict) or cache.get("version") != _GENRE_CACHE_VERSION:
+        return {}
+    
+    return cache.get("files", {})
+
+def _save_genre_cache(cache_path: Path, files: Dict[str, list]) -> None:
+    """
+    Write the genre cache, ignoring failures (e.g. a read-only folder).
+    """
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": _GENRE_CACHE_VERSION, "files": files}, f, ensure_ascii=False)
+    except OSError as e:
+        log.warning("Could not write genre cache %s: %s", cache_path, e)
+
+def _extract_one(file_path: str) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Read one wiki page and extract its infobox genres, returning (genres, error).
+    Kept at module level so it can be sent to worker processes.
+    """
+    try:
+        # Map the file instead of reading and decoding it
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None, None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # Extract genres from infobox
+                return extract_genres_from_infobox(content), None
+    except Exception as e:
+        return None, str(e)
+
+def process_wiki_files(folder_path: str, use_cache: bool = True, processes: Optional[int] = None) -> Dict[str, List[str]]:
     """
     Process all .txt files in the folder and extract genres for each artist.
+    With use_cache, files whose mtime and size are unchanged since the last run are not re-read.
+    Files that do need parsing are spread over a pool of processes (default: one per CPU).
     """
     artist_genres = {}
     
@@ -289,39 +384,67 @@ def process_wiki_files(folder_path: str) -> Dict[str, List[str]]:
     if not folder.exists():
         raise ValueError(f"Folder {folder_path} does not exist")
     
-    # Process all .txt files
-    txt_files = list(folder.glob("*.txt"))
+    # Process all .txt files, DirEntry gives us the path and a cached stat without extra calls
+    with os.scandir(folder) as it:
+        txt_files = [file_entry for file_entry in it if file_entry.name.endswith('.txt') and file_entry.is_file()]
+    
+    cache_path = folder / GENRE_CACHE_FILE
+    cached = _load_genre_cache(cache_path) if use_cache else {}
+    new_cache = {}
     
     print(f"Found {len(txt_files)} .txt files to process...")
     print("-" * 50)
     
+    # Reuse cached genres where the file is unchanged, queue the rest for parsing
+    results = {}
+    to_parse = []
+    for file_entry in txt_files:
+        try:
+            stat = file_entry.stat()
+        except OSError as e:
+            results[file_entry.name] = (None, str(e))
+            continue
+        
+        entry = cached.get(file_entry.name)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            results[file_entry.name] = (entry[2], None)
+        else:
+            to_parse.append(file_entry)
+        new_cache[file_entry.name] = [stat.st_mtime_ns, stat.st_size, None]
+    
+    if to_parse:
+        with Pool(processes) as pool:
+            parsed = pool.imap(_extract_one, [file_entry.path for file_entry in to_parse], chunksize=32)
+            results.update(zip([file_entry.name for file_entry in to_parse], parsed))
+    
     success_count = 0
     failure_count = 0
     
-    for file_path in txt_files:
-        try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Extract artist name from filename
-            artist_name = extract_artist_name_from_filename(file_path.name)
-            
-            # Extract genres from infobox
-            genres = extract_genres_from_infobox(content)
-            
-            if genres:
-                artist_genres[artist_name] = genres
-                print(f"✓ {artist_name}: {', '.join(genres)}")
-                success_count += 1
-            else:
-                print(f"✗ {artist_name}: No genres found in infobox")
-                failure_count += 1
-                
-        except Exception as e:
-            print(f"ERROR processing {file_path.name}: {e}")
+    for file_entry in txt_files:
+        genres, error = results[file_entry.name]
+        
+        if error is not None:
+            log.error("ERROR processing %s: %s", file_entry.name, error)
+            failure_count += 1
+            new_cache.pop(file_entry.name, None)
+            continue
+        
+        new_cache[file_entry.name][2] = genres
+        
+        # Extract artist name from filename
+        artist_name = extract_artist_name_from_filename(file_entry.name)
+        
+        if genres:
+            artist_genres[artist_name] = genres
+            log.info("✓ %s: %s", artist_name, ', '.join(genres))
+            success_count += 1
+        else:
+            log.info("✗ %s: No genres found in infobox", artist_name)
             failure_count += 1
     
+    if use_cache:
+        _save_genre_cache(cache_path, new_cache)
+    
     print("-" * 50)
     print(f"\nProcessing complete!")
     print(f"  Success: {success_count} artists with genres extracted")
@@ -331,6 +454,9 @@ def process_wiki_files(folder_path: str) -> Dict[str, List[str]]:
 
 # Main execution
 if __name__ == "__main__":
+    # Per-file results are logged at INFO, switch the level to see them
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
     # Set your folder path here
     FOLDER_PATH = "assignments/Assignment 1/wiki_pages"  # Change this to your actual folder path
     
@@ -362,7 +488,6 @@ if __name__ == "__main__":
             print(f"  {genre}: {count} artists")
         
         # Optionally save to JSON file
-        import json
         output_file = "artist_genres_without_rock.json"
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(artist_genre_dict, f, indent=2, ensure_ascii=False)
@@ -1,5 +1,7 @@
 import re
 import os
+import logging
+from multiprocessing import Pool
 from statistics import mean
 import networkx as nx
 from pathlib import Path
@@ -7,6 +9,8 @@ import json
 import csv
 import pickle
 
+log = logging.getLogger(__name__)
+
 def load_labmt_lexicon(filename='Data_Set_S1.txt'):
     """
     Loads the labMT (S1) dataset (tab-separated) and returns {word: happiness_average(float)}.
@@ -57,101 +61,123 @@ def load_wiki_pages(directory='wiki_pages'):
     """Load all downloaded wiki pages."""
     wiki_data = {}
     
-    for filename in os.listdir(directory):
-        if filename.endswith('.txt'):
-            filepath = os.path.join(directory, filename)
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # We need to map filenames back to artist names
-                # This is a bit tricky due to sanitization
-                wiki_data[filename[:-4]] = content  # Remove .txt
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith('.txt') and entry.is_file():
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    # We need to map filenames back to artist names
+                    # This is a bit tricky due to sanitization
+                    wiki_data[entry.name[:-4]] = content  # Remove .txt
     
     return wiki_data
 
+# Pattern to match [[Link]] or [[Link|Display Text]]
+_LINK_RE = re.compile(r'\[\[([^\[\]|]+?)(?:\|[^\[\]]+)?\]\]')
+
 def extract_wiki_links(text):
     """Extract all internal Wikipedia links from wikitext."""
-    # Pattern to match [[Link]] or [[Link|Display Text]]
-    pattern = r'\[\[([^\[\]|]+?)(?:\|[^\[\]]+)?\]\]'
-    matches = re.findall(pattern, text)
+    matches = _LINK_RE.findall(text)
     
     # Clean up the links
     links = []
     for match in matches:
         # Remove any section anchors (e.g., "Page#Section" -> "Page")
-        link = match.split('#')[0].strip()
+        link = match.split('#', 1)[0].strip()
         if link:
             links.append(link)
     
     return links
 
-def build_artist_network(artist_list, wiki_data, lexicon):
-    """Build a directed graph of artist connections."""
+def _canonical_name(name):
+    """Canonical form for matching links and filenames to artists: spaces instead of underscores, no section anchor."""
+    return name.replace('_', ' ').split('#', 1)[0].strip()
+
+# Per-worker state for build_artist_network, set once per process by _init_page_worker
+_worker_artist_lookup = None
+_worker_lexicon = None
+
+def _init_page_worker(artist_lookup, lexicon):
+    """Hand the artist lookup and lexicon to a worker once instead of with every page."""
+    global _worker_artist_lookup, _worker_lexicon
+    _worker_artist_lookup = artist_lookup
+    _worker_lexicon = lexicon
+
+def _scan_page(content):
+    """
+    Returns (artist_links, word_count, happiness_average) for one page.
+    Runs in a worker process, using the state set by _init_page_worker.
+    """
+    # Filter links to the ones pointing to other artists while scanning,
+    # without building the list of every link on the page first
+    artist_links = []
+    for match in _LINK_RE.finditer(content):
+        # Check if this link points to another artist
+        target = _worker_artist_lookup.get(_canonical_name(match.group(1)))
+        if target is not None:
+            artist_links.append(target)
+    
+    word_count = len(content.split())
+    avg, matched, total = page_happiness_average(content, _worker_lexicon)
+    return artist_links, word_count, avg
+
+def build_artist_network(artist_list, wiki_data, lexicon, processes=None):
+    """
+    Build a directed graph of artist connections.
+    Pages are scanned in a pool of processes (default: one per CPU); the graph is built in this one.
+    """
     
-    # Create a set of valid artist names for faster lookup
-    artist_set = set(artist_list)
+    # Map canonical names to artists, so each link or filename needs a single lookup
+    artist_lookup = {_canonical_name(artist): artist for artist in artist_list}
     
-    # Also create variations to handle naming differences
-    artist_variations = {}
-    for artist in artist_list:
-        # Store original
-        artist_variations[artist] = artist
-        # Store with underscores
-        artist_variations[artist.replace(' ', '_')] = artist
-        # Store sanitized version
-        sanitized = artist.replace('/', '_').replace('–', '-')
-        artist_variations[sanitized] = artist
-        artist_variations[sanitized.replace(' ', '_')] = artist
+    # Filenames may also use the sanitized name (e.g. AC_DC for AC/DC)
+    page_lookup = {_canonical_name(artist.replace('/', '_').replace('–', '-')): artist for artist in artist_list}
+    page_lookup.update(artist_lookup)
     
     # Create directed graph
     G = nx.DiGraph()
     
     # Add all artists as nodes
-    for artist in artist_list:
-        G.add_node(artist)
+    G.add_nodes_from(artist_list)
     
     # Track statistics
     links_found = {}
     
-    # Process each artist's page
+    # Collected while scanning, then added to the graph in bulk
+    edges = []
+    word_counts = {}
+    happiness = {}
+    
+    # Map each page's filename back to an artist name
+    sources = []
+    contents = []
     for filename, content in wiki_data.items():
-        # Try to map filename back to artist name
-        source_artist = None
-        
-        # Try different variations
-        if filename in artist_variations:
-            source_artist = artist_variations[filename]
-        elif filename.replace('_', ' ') in artist_variations:
-            source_artist = artist_variations[filename.replace('_', ' ')]
+        source_artist = page_lookup.get(_canonical_name(filename))
         
         if not source_artist:
-            print(f"Warning: Could not map {filename} to an artist")
+            log.warning("Could not map %s to an artist", filename)
             continue
         
-        # Extract all links from this page
-        all_links = extract_wiki_links(content)
-        
-        # Filter to only links pointing to other artists
-        artist_links = []
-        for link in all_links:
-            # Check if this link points to another artist
-            if link in artist_set:
-                artist_links.append(link)
-                G.add_edge(source_artist, link)
-            elif link.replace('_', ' ') in artist_set:
-                target = link.replace('_', ' ')
-                artist_links.append(target)
-                G.add_edge(source_artist, target)
-        
-        links_found[source_artist] = artist_links
-        
-        # Add word count as node attribute
-        word_count = len(content.split())
-        G.nodes[source_artist]['word_count'] = word_count
-
-        avg, matched, total = page_happiness_average(content, lexicon)
-        G.nodes[source_artist]['happiness_average'] = avg
-        
-        print(f"Processed {source_artist}: {len(artist_links)} links to other artists")
+        sources.append(source_artist)
+        contents.append(content)
+    
+    # Scan the pages in parallel, NetworkX itself is only touched from this process
+    with Pool(processes, initializer=_init_page_worker, initargs=(artist_lookup, lexicon)) as pool:
+        for source_artist, (artist_links, word_count, avg) in zip(sources, pool.imap(_scan_page, contents, chunksize=32)):
+            edges.extend((source_artist, target) for target in artist_links)
+            
+            links_found[source_artist] = artist_links
+            
+            word_counts[source_artist] = word_count
+            happiness[source_artist] = avg
+            
+            log.info("Processed %s: %d links to other artists", source_artist, len(artist_links))
+    
+    G.add_edges_from(edges)
+    
+    # Add word count and happiness as node attributes
+    nx.set_node_attributes(G, word_counts, 'word_count')
+    nx.set_node_attributes(G, happiness, 'happiness_average')
     
     return G, links_found
 
@@ -215,12 +241,14 @@ def main():
     
     # Also save as edge list for easier inspection
     with open('network_edges.txt', 'w', encoding='utf-8') as f:
-        for source, target in G_clean.edges():
-            f.write(f"{source} -> {target}\n")
+        f.write(''.join(f"{source} -> {target}\n" for source, target in G_clean.edges()))
     
     return G_clean
 
 if __name__ == "__main__":
+    # Per-page progress is logged at INFO, switch the level to see it
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
     G = main()
     
     # Print some basic statistics